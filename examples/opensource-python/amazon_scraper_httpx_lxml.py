@@ -0,0 +1,416 @@
+"""
+amazon scraper - open source implementation
+scrape amazon product data using HTTPX and lxml.
+extracts: availability, avg_rating, category, description, out_of_stock, price, review_count, ships_from, sold_by, title, features, images
+requirements:
+    pip install "httpx[http2,brotli]" lxml orjson
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import AsyncIterator, BinaryIO, Optional
+
+import httpx
+import orjson
+from lxml import etree, html
+
+# configuration
+TARGET_URL = (
+    "https://www.amazon.com/Logitech-Master-Bluetooth-Wireless-Receiver/dp/B0FB21526X"
+)
+
+# product urls to scrape concurrently
+TARGET_URLS = [TARGET_URL]
+
+# on-disk page cache so re-runs do not download the same pages again; amazon sends no
+# etag or last-modified validators, so a stored page is replayed as-is without any
+# revalidation until CACHE_TTL expires
+CACHE_DIR = ".cache/amazon"
+CACHE_TTL = 3600  # seconds
+
+# realistic browser headers to mimic a real user request
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# xpath expressions for data extraction (update these based on current amazon html structure)
+XPATHS = {
+    "title": './/*[@id="productTitle"]',
+    "price": (
+        './/span[contains(concat(" ", normalize-space(@class), " "), " a-price ")]'
+        '//span[contains(concat(" ", normalize-space(@class), " "), " a-offscreen ")]'
+    ),
+    "avg_rating": './/span[contains(concat(" ", normalize-space(@class), " "), " a-icon-alt ")]',
+    "review_count": './/*[@id="acrCustomerReviewText"]',
+    "availability": './/*[@id="availability"]//span',
+    "description": './/*[@id="productDescription"]//p',
+    "features": (
+        './/*[@id="feature-bullets"]//ul//li'
+        '//span[contains(concat(" ", normalize-space(@class), " "), " a-list-item ")]'
+    ),
+    "images": './/*[@id="imgTagWrapperId"]//img',
+    "category": './/*[@id="wayfinding-breadcrumbs_feature_div"]//ul//li//a',
+    "ships_from": (
+        './/*[@id="tabular-buybox-truncate-0"]'
+        '//span[contains(concat(" ", normalize-space(@class), " "), " tabular-buybox-text ")]'
+    ),
+    "sold_by": (
+        './/*[@id="tabular-buybox-truncate-1"]'
+        '//span[contains(concat(" ", normalize-space(@class), " "), " tabular-buybox-text ")]'
+    ),
+    "thumbnails": (
+        './/*[@id="altImages"]'
+        '//img[contains(concat(" ", normalize-space(@class), " "), " a-dynamic-image ")]'
+    ),
+}
+
+# fields whose value is the text of the first matching element
+SIMPLE_FIELDS = (
+    "title",
+    "price",
+    "availability",
+    "description",
+    "ships_from",
+    "sold_by",
+)
+
+# xpath expressions compiled once and reused for every page
+COMPILED_XPATHS = {name: etree.XPath(expr) for name, expr in XPATHS.items()}
+
+# page sections that hold the product data, the rest is discarded while parsing
+SECTION_IDS = {
+    "wayfinding-breadcrumbs_feature_div",
+    "leftCol",
+    "centerCol",
+    "rightCol",
+    "feature-bullets",
+    "productDescription",
+}
+
+# number of html bytes fed to the parser at a time
+PARSE_CHUNK_SIZE = 16384
+
+# the footer comes after every product section, the download stops once it is reached
+FOOTER_ID = "navFooter"
+
+# regex patterns compiled once and reused for every page
+RATING_RE = re.compile(r"(\d+\.?\d*)\s*out of")
+REVIEW_COUNT_RE = re.compile(r"([\d,]+)")
+IMAGE_SIZE_RE = re.compile(r"\._[A-Z]+\d+_\.")
+
+# common out of stock indicators, matched in a single case-insensitive pass
+OUT_OF_STOCK_KEYWORDS = ("out of stock", "unavailable", "currently unavailable")
+OUT_OF_STOCK_RE = re.compile(
+    "|".join(map(re.escape, OUT_OF_STOCK_KEYWORDS)), re.IGNORECASE
+)
+
+
+def create_client() -> httpx.AsyncClient:
+    """create an http client whose connections are shared by all requests"""
+    # http/2 multiplexes concurrent requests over a few sockets; the pool caps how many
+    # connections are opened and retries connection failures
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=32),
+    )
+    return httpx.AsyncClient(headers=HEADERS, timeout=30, transport=transport)
+
+
+def get_cache_path(url: str) -> str:
+    """return the cache file that stores the page of a url"""
+    return os.path.join(CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + ".html")
+
+
+def is_cache_fresh(cache_path: str) -> bool:
+    """check whether a cached page exists and is younger than CACHE_TTL"""
+    try:
+        return time.time() - os.path.getmtime(cache_path) < CACHE_TTL
+    except FileNotFoundError:
+        return False
+
+
+async def read_cached_chunks(cache_path: str) -> AsyncIterator[bytes]:
+    """yield a cached page in parser sized chunks"""
+    with open(cache_path, "rb") as cache_file:
+        while chunk := cache_file.read(PARSE_CHUNK_SIZE):
+            yield chunk
+
+
+async def copy_chunks(
+    chunks: AsyncIterator[bytes], cache_file: BinaryIO
+) -> AsyncIterator[bytes]:
+    """pass chunks through while writing each one to the cache file"""
+    async for chunk in chunks:
+        cache_file.write(chunk)
+        yield chunk
+
+
+async def download_page(
+    client: httpx.AsyncClient, url: str, cache_path: str
+) -> html.HtmlElement:
+    """stream the page into the parser, keeping the parsed bytes as its cached copy"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # written to a temporary file first so concurrent runs never read half a page
+    part = tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".part", delete=False)
+    try:
+        with part:
+            # send get request with browser-like headers, reusing pooled connections
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+
+                # parse html content with lxml while it downloads; leaving this block
+                # at the footer closes the stream before the rest of the page is sent
+                chunks = copy_chunks(response.aiter_bytes(PARSE_CHUNK_SIZE), part)
+                tree = await parse_product_sections(chunks)
+
+        # amazon answers robot checks with a 200 too, never replay those from disk
+        if COMPILED_XPATHS["title"](tree):
+            os.replace(part.name, cache_path)
+        return tree
+    finally:
+        if os.path.exists(part.name):
+            os.remove(part.name)
+
+
+async def fetch_page(client: httpx.AsyncClient, url: str) -> Optional[html.HtmlElement]:
+    """fetch the page content and return a parsed html tree"""
+    cache_path = get_cache_path(url)
+    try:
+        if is_cache_fresh(cache_path):
+            # replay the stored page without touching the network
+            return await parse_product_sections(read_cached_chunks(cache_path))
+        return await download_page(client, url, cache_path)
+
+    except httpx.TimeoutException:
+        print("error: request timed out", file=sys.stderr)
+        return None
+    except httpx.ConnectError:
+        print("error: failed to connect to the server", file=sys.stderr)
+        return None
+    except httpx.HTTPStatusError as e:
+        print(f"error: http error occurred - {e}", file=sys.stderr)
+        return None
+    except httpx.HTTPError as e:
+        print(f"error: request failed - {e}", file=sys.stderr)
+        return None
+    except etree.LxmlError as e:
+        print(f"error: failed to parse the page - {e}", file=sys.stderr)
+        return None
+    except OSError as e:
+        print(f"error: failed to access the page cache - {e}", file=sys.stderr)
+        return None
+
+
+async def parse_product_sections(chunks: AsyncIterator[bytes]) -> html.HtmlElement:
+    """parse the page chunks into a small tree holding only the product sections"""
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    parser.set_element_class_lookup(html.HtmlElementClassLookup())
+
+    root = html.Element("div")
+    # raw bytes received before the first product section, kept for the fallback
+    # below and dropped as soon as the page turns out to have sections
+    received = []
+    # how many product sections the current element is nested in
+    depth = 0
+    footer_reached = False
+    async for chunk in chunks:
+        if received is not None:
+            received.append(chunk)
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            element_id = element.get("id")
+            in_section = element_id in SECTION_IDS
+            if event == "start":
+                if element_id == FOOTER_ID:
+                    footer_reached = True
+                    break
+                if in_section:
+                    depth += 1
+                    received = None
+            elif in_section:
+                depth -= 1
+                # keep outermost sections, nested ones travel with their parent
+                if depth == 0:
+                    root.append(element)
+            elif depth == 0:
+                # outside every section, free the element as soon as it is parsed
+                # and detach the already cleared siblings before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        if footer_reached:
+            # the trailing scripts and widgets are never parsed
+            break
+    parser.close()
+
+    if received is not None:
+        # unknown page layout, search the whole document instead
+        return html.fromstring(b"".join(received))
+
+    # script and style contents are never part of the product data
+    etree.strip_elements(root, "script", "style", with_tail=False)
+    return root
+
+
+def extract_simple_fields(tree: html.HtmlElement) -> dict:
+    """extract every field that is the plain text of its first matching element"""
+    fields = {}
+    for name in SIMPLE_FIELDS:
+        elements = COMPILED_XPATHS[name](tree)
+        fields[name] = elements[0].text_content().strip() if elements else None
+    return fields
+
+
+def extract_avg_rating(tree: html.HtmlElement) -> Optional[str]:
+    """extract the average rating"""
+    elements = COMPILED_XPATHS["avg_rating"](tree)
+    if elements:
+        # extract rating value from text like "4.5 out of 5 stars"
+        rating_text = elements[0].text_content().strip()
+        match = RATING_RE.search(rating_text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def extract_review_count(tree: html.HtmlElement) -> Optional[str]:
+    """extract the number of reviews"""
+    elements = COMPILED_XPATHS["review_count"](tree)
+    if elements:
+        # extract number from text like "1,234 ratings"
+        review_text = elements[0].text_content().strip()
+        match = REVIEW_COUNT_RE.search(review_text)
+        if match:
+            return match.group(1).replace(",", "")
+    return None
+
+
+def parse_out_of_stock(availability: Optional[str]) -> bool:
+    """determine if the product is out of stock"""
+    if availability:
+        # check for common out of stock indicators
+        return OUT_OF_STOCK_RE.search(availability) is not None
+    return False
+
+
+def extract_features(tree: html.HtmlElement) -> list[str]:
+    """extract the product feature bullet points"""
+    elements = COMPILED_XPATHS["features"](tree)
+    features = []
+    for element in elements:
+        text = element.text_content().strip()
+        # filter out empty strings and very short text
+        if text and len(text) > 5:
+            features.append(text)
+    return features
+
+
+def extract_images(tree: html.HtmlElement) -> list[str]:
+    """extract product image urls"""
+    images = []
+    # urls already collected, for constant time duplicate checks
+    seen = set()
+    # try main product image first
+    main_imgs = COMPILED_XPATHS["images"](tree)
+    if main_imgs:
+        # get the high-res image url from data attributes or src
+        img_url = main_imgs[0].get("data-old-hires") or main_imgs[0].get("src")
+        if img_url and img_url.startswith("http"):
+            seen.add(img_url)
+            images.append(img_url)
+
+    # try to find additional images in the thumbnail strip
+    thumbnail_elements = COMPILED_XPATHS["thumbnails"](tree)
+    for thumb in thumbnail_elements:
+        img_url = thumb.get("src")
+        if img_url and img_url.startswith("http"):
+            # convert thumbnail url to larger image url
+            large_url = IMAGE_SIZE_RE.sub("._AC_SL1500_.", img_url)
+            if large_url not in seen:
+                seen.add(large_url)
+                images.append(large_url)
+
+    return images
+
+
+def extract_category(tree: html.HtmlElement) -> Optional[str]:
+    """extract the product category breadcrumb"""
+    elements = COMPILED_XPATHS["category"](tree)
+    if elements:
+        # build category path from breadcrumbs
+        categories = [el.text_content().strip() for el in elements]
+        return " > ".join(categories)
+    return None
+
+
+async def scrape_amazon_product(client: httpx.AsyncClient, url: str) -> Optional[dict]:
+    """main function to scrape all product data from an amazon url"""
+    # fetch the page content
+    tree = await fetch_page(client, url)
+    if tree is None:
+        return None
+
+    # extract the plain text fields in one pass over the field table
+    fields = extract_simple_fields(tree)
+
+    # extract all data points
+    product_data = {
+        "title": fields["title"],
+        "price": fields["price"],
+        "avg_rating": extract_avg_rating(tree),
+        "review_count": extract_review_count(tree),
+        "availability": fields["availability"],
+        "out_of_stock": parse_out_of_stock(fields["availability"]),
+        "description": fields["description"],
+        "features": extract_features(tree),
+        "images": extract_images(tree),
+        "category": extract_category(tree),
+        "ships_from": fields["ships_from"],
+        "sold_by": fields["sold_by"],
+        "url": url,
+    }
+
+    return product_data
+
+
+async def scrape_many(urls: list[str]) -> list[Optional[dict]]:
+    """scrape several product urls concurrently over one shared client"""
+    async with create_client() as client:
+        return await asyncio.gather(
+            *(scrape_amazon_product(client, url) for url in urls)
+        )
+
+
+def main():
+    """main execution entry point"""
+    print(f"scraping: {', '.join(TARGET_URLS)}\n")
+
+    # scrape the product data
+    results = asyncio.run(scrape_many(TARGET_URLS))
+
+    failed = False
+    for url, product_data in zip(TARGET_URLS, results):
+        if product_data:
+            # output as formatted json
+            print(orjson.dumps(product_data, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(f"failed to scrape product data: {url}", file=sys.stderr)
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
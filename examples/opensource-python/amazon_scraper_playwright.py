@@ -3,22 +3,42 @@ amazon scraper - open source implementation
 scrape amazon product data using Playwright.
 extracts: availability, avg_rating, category, description, out_of_stock, price, review_count, ships_from, sold_by, title, features, images
 requirements:
-    pip install playwright
+    pip install playwright orjson
     playwright install chromium
 """
 
-import json
+import asyncio
 import re
 import sys
+from collections import OrderedDict
 from typing import Optional
 
-from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeout
+import orjson
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Playwright,
+    Response,
+    Route,
+    TimeoutError as PlaywrightTimeout,
+    async_playwright,
+)
 
 # configuration
 TARGET_URL = (
     "https://www.amazon.com/Logitech-Master-Bluetooth-Wireless-Receiver/dp/B0FB21526X"
 )
 
+# product urls to scrape concurrently with a shared browser
+TARGET_URLS = [TARGET_URL]
+
+# maximum number of pages loading at the same time
+CONCURRENCY = 10
+
+# relaunch the browser after this many pages to keep its memory bounded
+MAX_PAGES_PER_BROWSER = 100
+
 # realistic browser user agent
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 
@@ -35,226 +55,257 @@ SELECTORS = {
     "category": "#wayfinding-breadcrumbs_feature_div ul li a",
     "ships_from": "#tabular-buybox-truncate-0 span.tabular-buybox-text",
     "sold_by": "#tabular-buybox-truncate-1 span.tabular-buybox-text",
+    "thumbnails": "#altImages img.a-dynamic-image",
 }
 
+# regex patterns compiled once and reused for every page
+RATING_RE = re.compile(r"(\d+\.?\d*)\s*out of")
+REVIEW_COUNT_RE = re.compile(r"([\d,]+)")
+IMAGE_SIZE_RE = re.compile(r"\._[A-Z]+\d+_\.")
 
-def extract_title(page: Page) -> Optional[str]:
-    """extract the product title"""
-    try:
-        element = page.query_selector(SELECTORS["title"])
-        if element:
-            return element.inner_text().strip()
-    except Exception:
-        pass
-    return None
+# common out of stock indicators, matched in a single case-insensitive pass
+OUT_OF_STOCK_KEYWORDS = ("out of stock", "unavailable", "currently unavailable")
+OUT_OF_STOCK_RE = re.compile(
+    "|".join(map(re.escape, OUT_OF_STOCK_KEYWORDS)), re.IGNORECASE
+)
+
+# resource types that are not needed to read the product data
+# (stylesheets are kept because innerText depends on computed styles)
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# ad and analytics hosts that only slow down the page load
+BLOCKED_HOSTS = ("doubleclick", "google-analytics", "amazon-adsystem")
+
+# assets shared by every product page, served from memory after the first download
+CACHED_RESOURCE_TYPES = {"script", "stylesheet"}
+
+# maximum number of asset responses kept in memory
+ASSET_CACHE_SIZE = 256
+
+# in-memory lru cache of asset responses (status, headers and body) keyed by url
+ASSET_CACHE = OrderedDict()
+
+# javascript run inside the page to read every field in a single round trip
+EXTRACT_JS = """
+(selectors) => {
+    const text = (selector) => {
+        const element = document.querySelector(selector);
+        return element ? element.innerText.trim() : null;
+    };
+    const texts = (selector) =>
+        Array.from(document.querySelectorAll(selector), (element) => element.innerText.trim());
+    const mainImg = document.querySelector(selectors.images);
+    return {
+        title: text(selectors.title),
+        price: text(selectors.price),
+        avg_rating: text(selectors.avg_rating),
+        review_count: text(selectors.review_count),
+        availability: text(selectors.availability),
+        description: text(selectors.description),
+        features: texts(selectors.features),
+        main_image: mainImg
+            ? mainImg.getAttribute("data-old-hires") || mainImg.getAttribute("src")
+            : null,
+        thumbnails: Array.from(
+            document.querySelectorAll(selectors.thumbnails),
+            (element) => element.getAttribute("src"),
+        ),
+        category: texts(selectors.category),
+        ships_from: text(selectors.ships_from),
+        sold_by: text(selectors.sold_by),
+    };
+}
+"""
 
 
-def extract_price(page: Page) -> Optional[str]:
-    """extract the product price"""
-    try:
-        element = page.query_selector(SELECTORS["price"])
-        if element:
-            return element.inner_text().strip()
-    except Exception:
-        pass
-    return None
+async def handle_route(route: Route) -> None:
+    """abort heavy assets and trackers, serve repeated assets from memory"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        host in request.url for host in BLOCKED_HOSTS
+    ):
+        await route.abort()
+        return
 
+    cached = ASSET_CACHE.get(request.url) if request.method == "GET" else None
+    if cached:
+        ASSET_CACHE.move_to_end(request.url)
+        await route.fulfill(**cached)
+    else:
+        await route.continue_()
 
-def extract_avg_rating(page: Page) -> Optional[str]:
-    """extract the average rating"""
-    try:
-        element = page.query_selector(SELECTORS["avg_rating"])
-        if element:
-            # extract rating value from text like "4.5 out of 5 stars"
-            rating_text = element.inner_text().strip()
-            match = re.search(r"(\d+\.?\d*)\s*out of", rating_text)
-            if match:
-                return match.group(1)
-    except Exception:
-        pass
-    return None
 
+async def cache_response(response: Response) -> None:
+    """remember successful asset responses so later pages can reuse them"""
+    request = response.request
+    if (
+        request.resource_type not in CACHED_RESOURCE_TYPES
+        or request.method != "GET"
+        or not response.ok
+        or request.url in ASSET_CACHE
+    ):
+        return
 
-def extract_review_count(page: Page) -> Optional[str]:
-    """extract the number of reviews"""
     try:
-        element = page.query_selector(SELECTORS["review_count"])
-        if element:
-            # extract number from text like "1,234 ratings"
-            review_text = element.inner_text().strip()
-            match = re.search(r"([\d,]+)", review_text)
-            if match:
-                return match.group(1).replace(",", "")
-    except Exception:
-        pass
+        body = await response.body()
+    except PlaywrightError:
+        # the body is no longer available, e.g. the page was closed first
+        return
+
+    # the body is already decoded, so drop the headers describing the wire encoding
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name not in ("content-encoding", "content-length")
+    }
+    ASSET_CACHE[request.url] = {
+        "status": response.status,
+        "headers": headers,
+        "body": body,
+    }
+    if len(ASSET_CACHE) > ASSET_CACHE_SIZE:
+        ASSET_CACHE.popitem(last=False)
+
+
+def parse_avg_rating(rating_text: Optional[str]) -> Optional[str]:
+    """extract the average rating"""
+    if rating_text:
+        # extract rating value from text like "4.5 out of 5 stars"
+        match = RATING_RE.search(rating_text)
+        if match:
+            return match.group(1)
     return None
 
 
-def extract_availability(page: Page) -> Optional[str]:
-    """extract product availability status"""
-    try:
-        element = page.query_selector(SELECTORS["availability"])
-        if element:
-            return element.inner_text().strip()
-    except Exception:
-        pass
+def parse_review_count(review_text: Optional[str]) -> Optional[str]:
+    """extract the number of reviews"""
+    if review_text:
+        # extract number from text like "1,234 ratings"
+        match = REVIEW_COUNT_RE.search(review_text)
+        if match:
+            return match.group(1).replace(",", "")
     return None
 
 
-def extract_out_of_stock(page: Page) -> bool:
+def parse_out_of_stock(availability: Optional[str]) -> bool:
     """determine if the product is out of stock"""
-    availability = extract_availability(page)
     if availability:
         # check for common out of stock indicators
-        out_of_stock_keywords = ["out of stock", "unavailable", "currently unavailable"]
-        return any(keyword in availability.lower() for keyword in out_of_stock_keywords)
+        return OUT_OF_STOCK_RE.search(availability) is not None
     return False
 
 
-def extract_description(page: Page) -> Optional[str]:
-    """extract the product description"""
-    try:
-        element = page.query_selector(SELECTORS["description"])
-        if element:
-            return element.inner_text().strip()
-    except Exception:
-        pass
-    return None
+def parse_features(feature_texts: list[str]) -> list[str]:
+    """extract the product feature bullet points"""
+    # filter out empty strings and very short text
+    return [text for text in feature_texts if text and len(text) > 5]
 
 
-def extract_features(page: Page) -> list[str]:
-    """extract the product feature bullet points"""
-    features = []
-    try:
-        elements = page.query_selector_all(SELECTORS["features"])
-        for element in elements:
-            text = element.inner_text().strip()
-            # filter out empty strings and very short text
-            if text and len(text) > 5:
-                features.append(text)
-    except Exception:
-        pass
-    return features
-
-
-def extract_images(page: Page) -> list[str]:
+def parse_images(
+    main_image: Optional[str], thumbnails: list[Optional[str]]
+) -> list[str]:
     """extract product image urls"""
     images = []
-    try:
-        # try main product image first
-        main_img = page.query_selector(SELECTORS["images"])
-        if main_img:
-            # get the high-res image url from data attributes or src
-            img_url = main_img.get_attribute(
-                "data-old-hires"
-            ) or main_img.get_attribute("src")
-            if img_url and img_url.startswith("http"):
-                images.append(img_url)
-
-        # try to find additional images in the thumbnail strip
-        thumbnail_elements = page.query_selector_all("#altImages img.a-dynamic-image")
-        for thumb in thumbnail_elements:
-            img_url = thumb.get_attribute("src")
-            if img_url and img_url.startswith("http"):
-                # convert thumbnail url to larger image url
-                large_url = re.sub(r"\._[A-Z]+\d+_\.", "._AC_SL1500_.", img_url)
-                if large_url not in images:
-                    images.append(large_url)
-    except Exception:
-        pass
+    # urls already collected, for constant time duplicate checks
+    seen = set()
+    # main product image comes first (high-res data attribute or src)
+    if main_image and main_image.startswith("http"):
+        seen.add(main_image)
+        images.append(main_image)
+
+    # additional images from the thumbnail strip
+    for img_url in thumbnails:
+        if img_url and img_url.startswith("http"):
+            # convert thumbnail url to larger image url
+            large_url = IMAGE_SIZE_RE.sub("._AC_SL1500_.", img_url)
+            if large_url not in seen:
+                seen.add(large_url)
+                images.append(large_url)
     return images
 
 
-def extract_category(page: Page) -> Optional[str]:
+def parse_category(categories: list[str]) -> Optional[str]:
     """extract the product category breadcrumb"""
-    try:
-        elements = page.query_selector_all(SELECTORS["category"])
-        if elements:
-            # build category path from breadcrumbs
-            categories = [el.inner_text().strip() for el in elements]
-            return " > ".join(categories)
-    except Exception:
-        pass
+    if categories:
+        # build category path from breadcrumbs
+        return " > ".join(categories)
     return None
 
 
-def extract_ships_from(page: Page) -> Optional[str]:
-    """extract the ships from information"""
-    try:
-        element = page.query_selector(SELECTORS["ships_from"])
-        if element:
-            return element.inner_text().strip()
-    except Exception:
-        pass
-    return None
+async def launch_browser(p: Playwright) -> Browser:
+    """launch a headless chromium browser with realistic settings"""
+    return await p.chromium.launch(
+        headless=True,
+        args=[
+            "--disable-blink-features=AutomationControlled",
+            "--no-sandbox",
+        ],
+    )
 
 
-def extract_sold_by(page: Page) -> Optional[str]:
-    """extract the sold by information"""
-    try:
-        element = page.query_selector(SELECTORS["sold_by"])
-        if element:
-            return element.inner_text().strip()
-    except Exception:
-        pass
-    return None
+async def create_context(browser: Browser) -> BrowserContext:
+    """create the browser context shared by all pages of a browser"""
+    # create browser context with realistic viewport and user agent
+    context = await browser.new_context(
+        user_agent=USER_AGENT,
+        viewport={"width": 1920, "height": 1080},
+        locale="en-US",
+    )
+
+    # skip images, fonts, media and trackers (image urls are still read from the html)
+    # and answer repeated script and stylesheet requests from the asset cache
+    await context.route("**/*", handle_route)
+    context.on("response", cache_response)
+    return context
 
 
-def scrape_amazon_product(url: str) -> Optional[dict]:
+async def scrape_amazon_product(context: BrowserContext, url: str) -> Optional[dict]:
     """main function to scrape all product data from an amazon url"""
     try:
-        # launch playwright with chromium browser
-        with sync_playwright() as p:
-            # launch browser in headless mode with realistic settings
-            browser = p.chromium.launch(
-                headless=True,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                ],
-            )
-
-            # create browser context with realistic viewport and user agent
-            context = browser.new_context(
-                user_agent=USER_AGENT,
-                viewport={"width": 1920, "height": 1080},
-                locale="en-US",
-            )
-
-            # create new page
-            page = context.new_page()
+        # create new page
+        page = await context.new_page()
 
+        try:
             # navigate to the product page
             print(f"navigating to: {url}")
-            page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
             # wait for main content to load
-            page.wait_for_selector("#productTitle", timeout=30000)
-
-            # small delay to allow dynamic content to render
-            page.wait_for_timeout(2000)
-
-            # extract all data points
-            product_data = {
-                "title": extract_title(page),
-                "price": extract_price(page),
-                "avg_rating": extract_avg_rating(page),
-                "review_count": extract_review_count(page),
-                "availability": extract_availability(page),
-                "out_of_stock": extract_out_of_stock(page),
-                "description": extract_description(page),
-                "features": extract_features(page),
-                "images": extract_images(page),
-                "category": extract_category(page),
-                "ships_from": extract_ships_from(page),
-                "sold_by": extract_sold_by(page),
-                "url": url,
-            }
-
-            # cleanup
-            browser.close()
-
-            return product_data
+            await page.wait_for_selector("#productTitle", timeout=30000)
+
+            # wait for the later-rendered sections instead of sleeping blindly
+            try:
+                await page.wait_for_selector(
+                    "#feature-bullets, #productDescription",
+                    state="attached",
+                    timeout=5000,
+                )
+            except PlaywrightTimeout:
+                # these sections are optional, extract whatever is available
+                pass
+
+            # read all raw field values from the dom in one round trip
+            raw = await page.evaluate(EXTRACT_JS, SELECTORS)
+        finally:
+            # cleanup, the context stays open for the next url
+            await page.close()
+
+        # post-process the raw values into the final data points
+        return {
+            "title": raw["title"],
+            "price": raw["price"],
+            "avg_rating": parse_avg_rating(raw["avg_rating"]),
+            "review_count": parse_review_count(raw["review_count"]),
+            "availability": raw["availability"],
+            "out_of_stock": parse_out_of_stock(raw["availability"]),
+            "description": raw["description"],
+            "features": parse_features(raw["features"]),
+            "images": parse_images(raw["main_image"], raw["thumbnails"]),
+            "category": parse_category(raw["category"]),
+            "ships_from": raw["ships_from"],
+            "sold_by": raw["sold_by"],
+            "url": url,
+        }
 
     except PlaywrightTimeout:
         print("error: page load timed out", file=sys.stderr)
@@ -264,18 +315,60 @@ def scrape_amazon_product(url: str) -> Optional[dict]:
         return None
 
 
+async def scrape_many(urls: list[str]) -> list[Optional[dict]]:
+    """scrape several product urls concurrently, sharing one browser context"""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def bounded_scrape(context: BrowserContext, url: str) -> Optional[dict]:
+        # limit how many pages are open at once
+        async with semaphore:
+            return await scrape_amazon_product(context, url)
+
+    results = []
+    async with async_playwright() as p:
+        # rotate the browser every batch of pages to bound memory growth
+        for start in range(0, len(urls), MAX_PAGES_PER_BROWSER):
+            batch = urls[start : start + MAX_PAGES_PER_BROWSER]
+            browser = None
+            try:
+                browser = await launch_browser(p)
+                context = await create_context(browser)
+            except PlaywrightError as e:
+                # e.g. chromium is not installed, every url of the batch fails
+                print(f"error: failed to scrape page - {e}", file=sys.stderr)
+                results.extend([None] * len(batch))
+                if browser is not None:
+                    await browser.close()
+                continue
+
+            try:
+                results.extend(
+                    await asyncio.gather(
+                        *(bounded_scrape(context, url) for url in batch)
+                    )
+                )
+            finally:
+                await browser.close()
+    return results
+
+
 def main():
     """main execution entry point"""
-    print(f"scraping: {TARGET_URL}\n")
+    print(f"scraping: {', '.join(TARGET_URLS)}\n")
 
     # scrape the product data
-    product_data = scrape_amazon_product(TARGET_URL)
-
-    if product_data:
-        # output as formatted json
-        print(json.dumps(product_data, indent=2, ensure_ascii=False))
-    else:
-        print("failed to scrape product data", file=sys.stderr)
+    results = asyncio.run(scrape_many(TARGET_URLS))
+
+    failed = False
+    for url, product_data in zip(TARGET_URLS, results):
+        if product_data:
+            # output as formatted json
+            print(orjson.dumps(product_data, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(f"failed to scrape product data: {url}", file=sys.stderr)
+            failed = True
+
+    if failed:
         sys.exit(1)
 
 
@@ -1,4 +1,5 @@
-# pip install requests
+# pip install requests orjson
+import orjson
 import requests
 
 url = "https://www.amazon.com/Logitech-Master-Bluetooth-Wireless-Receiver/dp/B0FB21526X"
@@ -11,4 +12,11 @@ params = {
     "autoparse": "true",
 }
 response = requests.get("https://api.zenrows.com/v1/", params=params)
-print(response.text)
+# autoparse returns json, decode it straight from the raw bytes
+try:
+    data = orjson.loads(response.content)
+except orjson.JSONDecodeError:
+    # not json (e.g. an error page or a page autoparse can't handle), print it as-is
+    print(response.text)
+else:
+    print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())